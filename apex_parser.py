@@ -1,7 +1,36 @@
 from pathlib import Path
+import bisect
+import mmap
+import os
 import re
 import json
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NAMESPACE_PATTERN = re.compile(r"^(\w+)\s+Namespace", re.MULTILINE)
+CLASS_PATTERN = re.compile(r"^(\w+)\s+Class", re.MULTILINE)
+METHOD_PATTERN = re.compile(r"^(public|private|protected)\s+\w+\s+\w+\(.*\)", re.MULTILINE)
+
+def read_text(input_path: Path) -> str:
+    """Read a UTF-8 text file by decoding its memory-mapped pages directly.
+
+    This skips the intermediate bytes copy of f.read(). Line endings are
+    normalized to \\n, as text-mode open() would do.
+    """
+    with open(input_path, 'rb') as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 class ApexDocParser:
     """Parser to extract and organize Apex Reference Guide content into structured JSON."""
@@ -24,61 +53,115 @@ class ApexDocParser:
 
     def extract_namespaces(self, text: str) -> List[Dict[str, Union[str, List]]]:
         """Extract namespaces and their classes, methods, and descriptions."""
-        namespace_pattern = re.compile(r"^(\w+)\s+Namespace", re.MULTILINE)
-        class_pattern = re.compile(r"^(\w+)\s+Class", re.MULTILINE)
-        method_pattern = re.compile(r"^(public|private|protected)\s+\w+\s+\w+\(.*\)")
-        
+        # Scan the text once per header kind, then bucket classes and methods
+        # under their enclosing section by offset
+        namespace_matches = list(NAMESPACE_PATTERN.finditer(text))
+        class_matches = list(CLASS_PATTERN.finditer(text))
+        method_matches = list(METHOD_PATTERN.finditer(text))
+        class_starts = [m.start() for m in class_matches]
+        method_starts = [m.start() for m in method_matches]
+
         namespaces = []
         
-        for match in namespace_pattern.finditer(text):
+        for i, match in enumerate(namespace_matches):
+            namespace_end = namespace_matches[i + 1].start() if i + 1 < len(namespace_matches) else len(text)
+            first_class = bisect.bisect_left(class_starts, match.end())
+            last_class = bisect.bisect_left(class_starts, namespace_end)
             namespace = {
                 "name": match.group(1),
-                "description": self.extract_section_description(text, match.end()),
+                "description": self.extract_section_description(
+                    text, match.end(), class_starts[first_class] if first_class < last_class else namespace_end),
                 "classes": []
             }
             
-            class_matches = class_pattern.finditer(text, match.end())
-            for class_match in class_matches:
+            for j in range(first_class, last_class):
+                class_match = class_matches[j]
+                class_end = class_starts[j + 1] if j + 1 < last_class else namespace_end
+                first_method = bisect.bisect_left(method_starts, class_match.end())
+                last_method = bisect.bisect_left(method_starts, class_end)
                 class_def = {
                     "name": class_match.group(1),
-                    "description": self.extract_section_description(text, class_match.end()),
+                    "description": self.extract_section_description(
+                        text, class_match.end(), method_starts[first_method] if first_method < last_method else class_end),
                     "methods": []
                 }
                 
-                method_matches = method_pattern.finditer(text, class_match.end())
-                for method_match in method_matches:
+                for k in range(first_method, last_method):
+                    method_match = method_matches[k]
                     method_def = {
                         "signature": method_match.group(0),
-                        "description": self.extract_section_description(text, method_match.end())
+                        "description": self.extract_section_description(
+                            text, method_match.end(), method_starts[k + 1] if k + 1 < last_method else class_end)
                     }
                     class_def["methods"].append(method_def)
                 namespace["classes"].append(class_def)
-
-                # Break the loop if encountering a new namespace
-                if namespace_pattern.search(text, class_match.end()):
-                    break
             
             namespaces.append(namespace)
         
         return namespaces
 
-    def extract_section_description(self, text: str, start_pos: int) -> str:
-        """Extract the section description immediately following a match."""
-        end_pos = text.find("\n\n", start_pos)
-        return text[start_pos:end_pos].strip() if end_pos != -1 else text[start_pos:].strip()
+    def extract_section_description(self, text: str, start_pos: int, limit: Optional[int] = None) -> str:
+        """Extract the section description immediately following a match.
+
+        The description ends at the next blank line, or at `limit` (the start of
+        the next header) when no blank line comes first.
+        """
+        limit = len(text) if limit is None else limit
+        end_pos = text.find("\n\n", start_pos, limit)
+        return text[start_pos:end_pos].strip() if end_pos != -1 else text[start_pos:limit].strip()
 
     def save_to_json(self, data: Dict, output_path: str):
         """Save the parsed content to a JSON file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly (never ASCII-escaped) and only supports 2-space indents
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump writes many small fragments; a 1MB buffer turns them into a few large writes
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+
+    def to_columns(self, data: Dict) -> Dict[str, Union[str, Dict[str, List]]]:
+        """Transpose parsed namespaces, classes and methods into parallel per-field lists.
+
+        Classes and methods keep a link to their parent as the row index of the
+        enclosing namespace or class.
+        """
+        namespaces = {"name": [], "description": []}
+        classes = {"name": [], "description": [], "namespace": []}
+        methods = {"signature": [], "description": [], "class": []}
+
+        for namespace_index, namespace in enumerate(data["namespaces"]):
+            namespaces["name"].append(namespace["name"])
+            namespaces["description"].append(namespace["description"])
+            for class_def in namespace["classes"]:
+                class_index = len(classes["name"])
+                classes["name"].append(class_def["name"])
+                classes["description"].append(class_def["description"])
+                classes["namespace"].append(namespace_index)
+                for method_def in class_def["methods"]:
+                    methods["signature"].append(method_def["signature"])
+                    methods["description"].append(method_def["description"])
+                    methods["class"].append(class_index)
+
+        return {
+            "title": data["title"],
+            "description": data["description"],
+            "namespaces": namespaces,
+            "classes": classes,
+            "methods": methods
+        }
+
+    def save_to_json_soa(self, data: Dict, output_path: str):
+        """Save the parsed content to a JSON file as columns rather than nested records."""
+        self.save_to_json(self.to_columns(data), output_path)
 
 if __name__ == "__main__":
     input_path = Path("apex_reference.txt")
     output_path = Path("apex_reference.json")
 
     if input_path.exists():
-        with open(input_path, 'r', encoding='utf-8') as f:
-            text_content = f.read()
+        text_content = read_text(input_path)
         
         parser = ApexDocParser(debug=True)
         parsed_data = parser.parse_document(text_content)
@@ -1,44 +1,110 @@
+import bisect
 import re
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def compile_linear(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 when it is installed, falling back to the stdlib re module.
+
+    RE2 matches in linear time but supports no lookarounds or backreferences,
+    so only patterns written without them should be compiled here. Flags are
+    passed to RE2 inline; a flag RE2 has no equivalent for raises ValueError
+    whether or not RE2 is installed, so behaviour never depends on the backend.
+    """
+    unsupported = flags & ~(re.UNICODE | re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    if unsupported:
+        raise ValueError(f'compile_linear does not support {re.RegexFlag(unsupported)!r}')
+    if re2 is None:
+        return re.compile(pattern, flags)
+    # RE2 matches str patterns as Unicode already, so re.UNICODE needs no inline flag
+    inline = ''.join(char for flag, char in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's')) if flags & flag)
+    return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
 
 class PDFPatterns:
     """Define improved patterns for extracting content from the Apex Reference Guide"""
 
     # Main document structure
-    TITLE = r'APEX\s+REFERENCE\s+GUIDE'
-    MAIN_DESC = r'Apex is a strongly typed.*?(?=\n\n)'
+    TITLE = re.compile(r'APEX\s+REFERENCE\s+GUIDE')
+    MAIN_DESC = re.compile(r'Apex is a strongly typed.*?(?=\n\n)', re.DOTALL)
 
     # Namespace patterns
-    NAMESPACE_START = r'^([A-Z][a-zA-Z]+)\s+Namespace\s*$'
-    NAMESPACE_DESC = r'(?<=Namespace\n)(.*?)(?=\n\n|\n[A-Z])'
+    NAMESPACE_START = re.compile(r'^([A-Z][a-zA-Z]+)\s+Namespace\s*$', re.MULTILINE)
+    NAMESPACE_DESC = compile_linear(r'Namespace\n(.*?)(?:\n\n|\n[A-Z])', re.DOTALL)
 
-    # DML Operation patterns
+    # DML Operation patterns; the sub-patterns run once per statement body (the
+    # text after the header line), so they avoid lookarounds to stay RE2-compatible
     DML_OPERATION = {
-        'start': r'^([A-Z][a-zA-Z]+)\s+Statement\s*$',
-        'syntax': r'Syntax\s*\n(.*?)(?=\n\n)',
-        'description': r'(?<=Statement\n)(.*?)(?=Syntax)',
-        'example': r'Example\s*\n(.*?)(?=\n\n(?:[A-Z]|\Z))'
+        'start': re.compile(r'^([A-Z][a-zA-Z]+)\s+Statement\s*$', re.MULTILINE),
+        'syntax': compile_linear(r'Syntax\s*\n(.*?)\n\n', re.DOTALL),
+        'description': compile_linear(r'\A\s*(.*?)Syntax', re.DOTALL),
+        'example': compile_linear(r'Example\s*\n(.*?)\n\n(?:[A-Z]|$)', re.DOTALL)
     }
 
     # Class patterns
-    CLASS_START = r'^([A-Z][a-zA-Z]+)\s+Class\s*$'
-    CLASS_DESC = r'Class\s+(.*?)(?=\n(?:IN THIS SECTION:|SEE ALSO:|public|private|protected))'
+    CLASS_START = re.compile(r'^([A-Z][a-zA-Z]+)\s+Class\s*$', re.MULTILINE)
+    CLASS_DESC = compile_linear(r'Class\s+(.*?)\n(?:IN THIS SECTION:|SEE ALSO:|public|private|protected)', re.DOTALL)
 
     # Method patterns
-    METHOD_START = r'^(?:public|private|protected)\s+\w+\s+\w+\s*\('
-    METHOD_DESC = r'(?:Signature\n.*?\nReturn Value\nType:.*?\n)(.*?)(?=\n(?:Example|Usage|SEE ALSO))'
+    METHOD_START = re.compile(r'^(?:public|private|protected)\s+\w+\s+\w+\s*\(', re.MULTILINE)
+    METHOD_DESC = compile_linear(r'Signature\n.*?\nReturn Value\nType:.*?\n(.*?)\n(?:Example|Usage|SEE ALSO)', re.DOTALL)
 
-    # Section markers
-    SECTION_MARKERS = [
+    # Section markers; the heading markers are also stripped from descriptions
+    HEADING_MARKERS = [
         'IN THIS SECTION:',
-        'SEE ALSO:',
+        'SEE ALSO:'
+    ]
+    SECTION_MARKERS = HEADING_MARKERS + [
         'Usage',
         'Example'
     ]
 
     # Content delimiters 
-    CODE_BLOCK = r'```.*?```'
-    NOTE_BLOCK = r'Note:.*?\n'
+    CODE_BLOCK = re.compile(r'```.*?```')
+    NOTE_BLOCK = re.compile(r'Note:.*?\n')
+
+# Markers and page tags stripped by ContentExtractor.clean_description, in one pass
+_MARKER_RE = re.compile('|'.join(map(re.escape, PDFPatterns.HEADING_MARKERS)) + r'|\[PAGE_\d+\]')
+
+# Sub-patterns applied to each namespace and method section
+_PAGE_START_RE = re.compile(r'\[PAGE_(\d+)\]')
+_PAGE_END_RE = re.compile(r'\[/PAGE_(\d+)\](?!.*\[/PAGE_\d+\])')
+_NAME_RE = compile_linear(r'\w+\s*\(')
+_PARAMS_RE = compile_linear(r'\((.*?)\)')
+_RETURN_TYPE_RE = compile_linear(r'Return.*?Type:\s*(\w+(?:\.\w+)*)', re.DOTALL)
+
+# Header matches and their start offsets, per section kind
+SectionIndex = Dict[str, Tuple[List[re.Match], List[int]]]
+
+def compile_section_start(kinds: Dict[str, re.Pattern]) -> re.Pattern:
+    """Join line-anchored header patterns into one alternation, one named group per kind.
+
+    A single scan then classifies every header line, and match.lastgroup gives
+    the kind. The leading ^ of each pattern is hoisted out of the alternation so
+    the engine only tries line starts, which needs every pattern to be compiled
+    with re.MULTILINE. IGNORECASE, DOTALL and ASCII are kept per alternative as
+    scoped inline flags; any other flag raises ValueError. Group numbers shift
+    inside the alternation, so the patterns must not use numbered backreferences.
+    """
+    alternatives = []
+    for kind, pattern in kinds.items():
+        if not pattern.pattern.startswith('^'):
+            raise ValueError(f"{kind} header pattern must start with '^': {pattern.pattern!r}")
+        # str patterns always carry re.UNICODE, and the combined pattern applies re.MULTILINE
+        flags = pattern.flags & ~re.UNICODE
+        if not flags & re.MULTILINE:
+            raise ValueError(f"{kind} header pattern must be compiled with re.MULTILINE: {pattern.pattern!r}")
+        flags &= ~re.MULTILINE
+        unsupported = flags & ~(re.IGNORECASE | re.DOTALL | re.ASCII)
+        if unsupported:
+            raise ValueError(f"{kind} header pattern uses unsupported {re.RegexFlag(unsupported)!r}")
+        inline = ''.join(char for flag, char in ((re.IGNORECASE, 'i'), (re.DOTALL, 's'), (re.ASCII, 'a')) if flags & flag)
+        body = f'(?{inline}:{pattern.pattern[1:]})' if inline else pattern.pattern[1:]
+        alternatives.append(f'(?P<{kind}>{body})')
+    return re.compile(f"^(?:{'|'.join(alternatives)})", re.MULTILINE)
 
 class ContentExtractor:
     """Extract and structure content from PDF text"""
@@ -47,48 +113,76 @@ class ContentExtractor:
         self.patterns = patterns
         self.current_page = 0
         self.debug = True
+        # Built from the injected patterns so subclasses that override a *_START pattern are honoured
+        self._section_kinds = {
+            'namespace': patterns.NAMESPACE_START,
+            'class': patterns.CLASS_START,
+            'method': patterns.METHOD_START
+        }
+        self._section_start = compile_section_start(self._section_kinds)
+
+    def index_sections(self, text: str) -> SectionIndex:
+        """Classify every section header in one scan, returning {kind: (matches, starts)}.
+
+        The nested extractors take the index as an argument rather than it being
+        cached on the instance, so the text and its matches are freed with the call.
+        """
+        index = {kind: ([], []) for kind in self._section_kinds}
+        for header in self._section_start.finditer(text):
+            # Re-match with the kind's own pattern so callers get its groups
+            match = self._section_kinds[header.lastgroup].match(text, header.start())
+            if match is None:
+                # The kind's own pattern is authoritative; skip a line it rejects rather than index None
+                continue
+            matches, starts = index[header.lastgroup]
+            matches.append(match)
+            starts.append(match.start())
+        return index
+
+    def iter_sections(self, kind: str, text: str, start: int = 0, end: Optional[int] = None,
+                      index: Optional[SectionIndex] = None):
+        """Yield (match, end_pos) for each `kind` header within text[start:end]; a section runs to the next header"""
+        end = len(text) if end is None else end
+        matches, starts = (self.index_sections(text) if index is None else index)[kind]
+        first = bisect.bisect_left(starts, start)
+        last = bisect.bisect_left(starts, end)
+        for i in range(first, last):
+            yield matches[i], starts[i + 1] if i + 1 < last else end
 
     def clean_description(self, text: str) -> str:
         """Clean unwanted markers, symbols, and excessive newlines from the description."""
         # Remove known markers and page numbers
-        text = re.sub(r'IN THIS SECTION:|SEE ALSO:', '', text)
-        text = re.sub(r'\[PAGE_\d+\]', '', text)
-        # Normalize multiple spaces and newlines
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        text = _MARKER_RE.sub('', text)
+        # Normalize multiple spaces and newlines; str.split() also drops leading/trailing whitespace
+        return ' '.join(text.split())
 
 
     def extract_dml_operations(self, text: str) -> Dict[str, List[Dict[str, Union[str, List[str]]]]]:
         """Extract DML operations with improved syntax and example handling."""
         operations = {'statements': []}
 
-        # Find all DML operation sections
-        operation_matches = re.finditer(self.patterns.DML_OPERATION['start'], text, re.MULTILINE)
+        # Carve the text on operation headers in one pass; the capturing group
+        # makes split() return [preamble, name1, body1, name2, body2, ...]
+        parts = self.patterns.DML_OPERATION['start'].split(text)
 
-        for match in operation_matches:
+        for name, operation_content in zip(parts[1::2], parts[2::2]):
             operation = {
-                'name': match.group(1) + ' Statement',
+                'name': name + ' Statement',
                 'description': '',
                 'syntax': [],
                 'example': ''
             }
 
-            # Get operation content
-            start_pos = match.start()
-            next_match = re.search(self.patterns.DML_OPERATION['start'], text[start_pos + 1:])
-            end_pos = next_match.start() + start_pos if next_match else len(text)
-            operation_content = text[start_pos:end_pos]
-
             # Extract components
-            syntax_match = re.search(self.patterns.DML_OPERATION['syntax'], operation_content, re.DOTALL)
+            syntax_match = self.patterns.DML_OPERATION['syntax'].search(operation_content)
             if syntax_match:
                 operation['syntax'] = [s.strip() for s in syntax_match.group(1).split('\n') if s.strip()]
 
-            desc_match = re.search(self.patterns.DML_OPERATION['description'], operation_content, re.DOTALL)
+            desc_match = self.patterns.DML_OPERATION['description'].search(operation_content)
             if desc_match:
                 operation['description'] = desc_match.group(1).strip()
 
-            example_match = re.search(self.patterns.DML_OPERATION['example'], operation_content, re.DOTALL)
+            example_match = self.patterns.DML_OPERATION['example'].search(operation_content)
             if example_match:
                 operation['example'] = example_match.group(1).strip()
 
@@ -99,11 +193,11 @@ class ContentExtractor:
     def extract_namespaces(self, text: str) -> List[Dict[str, Union[str, List, Dict[str, int]]]]:
         """Extract namespace sections with improved context awareness"""
         namespaces = []
+        # Index the headers once; the class and method extractors reuse it
+        index = self.index_sections(text)
 
         # Find all namespace sections
-        namespace_matches = re.finditer(self.patterns.NAMESPACE_START, text, re.MULTILINE)
-
-        for match in namespace_matches:
+        for match, end_pos in self.iter_sections('namespace', text, index=index):
             namespace = {
                 'name': match.group(1),
                 'description': '',
@@ -113,17 +207,15 @@ class ContentExtractor:
 
             # Get section content
             start_pos = match.start()
-            next_match = re.search(self.patterns.NAMESPACE_START, text[start_pos + 1:])
-            end_pos = next_match.start() + start_pos if next_match else len(text)
             section_content = text[start_pos:end_pos]
 
             # Extract description
-            desc_match = re.search(self.patterns.NAMESPACE_DESC, section_content, re.DOTALL)
+            desc_match = self.patterns.NAMESPACE_DESC.search(section_content)
             if desc_match:
                 namespace['description'] = self.clean_description(desc_match.group(1).strip())
 
             # Extract classes
-            classes = self.extract_classes(section_content)
+            classes = self.extract_classes(text, start_pos, end_pos, index)
             namespace['subsections'].extend(classes)
 
             # Find page numbers
@@ -135,22 +227,23 @@ class ContentExtractor:
 
     def find_page_range(self, content: str) -> Dict[str, int]:
         """Find page range for a section of content"""
-        start_match = re.search(r'\[PAGE_(\d+)\]', content)
-        end_match = re.search(r'\[/PAGE_(\d+)\](?!.*\[/PAGE_\d+\])', content)
+        start_match = _PAGE_START_RE.search(content)
+        end_match = _PAGE_END_RE.search(content)
 
         return {
             'start': int(start_match.group(1)) if start_match else 0,
             'end': int(end_match.group(1)) if end_match else 0
         }
 
-    def extract_classes(self, text: str) -> List[Dict[str, Union[str, List]]]:
+    def extract_classes(self, text: str, start: int = 0, end: Optional[int] = None,
+                        index: Optional[SectionIndex] = None) -> List[Dict[str, Union[str, List]]]:
         """Extract class information with improved method detection"""
         classes = []
+        if index is None:
+            index = self.index_sections(text)
 
         # Find all class definitions
-        class_matches = re.finditer(self.patterns.CLASS_START, text, re.MULTILINE)
-
-        for match in class_matches:
+        for match, end_pos in self.iter_sections('class', text, start, end, index):
             class_info = {
                 'name': match.group(1) + ' Class',
                 'description': '',
@@ -159,31 +252,28 @@ class ContentExtractor:
 
             # Get class content
             start_pos = match.start()
-            next_match = re.search(self.patterns.CLASS_START, text[start_pos + 1:])
-            end_pos = next_match.start() + start_pos if next_match else len(text)
             class_content = text[start_pos:end_pos]
 
             # Extract description
-            desc_match = re.search(self.patterns.CLASS_DESC, class_content, re.DOTALL)
+            desc_match = self.patterns.CLASS_DESC.search(class_content)
             if desc_match:
                 class_info['description'] = self.clean_description(desc_match.group(1).strip())
 
             # Extract methods
-            methods = self.extract_methods(class_content)
+            methods = self.extract_methods(text, start_pos, end_pos, index)
             class_info['methods'].extend(methods)
 
             classes.append(class_info)
 
         return classes
 
-    def extract_methods(self, text: str) -> List[Dict[str, Union[str, List[str]]]]:
+    def extract_methods(self, text: str, start: int = 0, end: Optional[int] = None,
+                        index: Optional[SectionIndex] = None) -> List[Dict[str, Union[str, List[str]]]]:
         """Extract method information with signature and parameter parsing."""
         methods = []
 
         # Find all method definitions
-        method_matches = re.finditer(self.patterns.METHOD_START, text, re.MULTILINE)
-
-        for match in method_matches:
+        for match, end_pos in self.iter_sections('method', text, start, end, index):
             method = {
                 'name': '',
                 'signature': '',
@@ -194,27 +284,26 @@ class ContentExtractor:
 
             # Get method content
             start_pos = match.start()
-            next_match = re.search(self.patterns.METHOD_START, text[start_pos + 1:])
-            end_pos = next_match.start() + start_pos if next_match else len(text)
             method_content = text[start_pos:end_pos]
 
-            # Parse signature
-            signature_lines = method_content.split('\n')[0]
-            method['signature'] = signature_lines.strip()
+            # Parse signature; it is the header line, so take its span rather than splitting the whole section
+            line_end = text.find('\n', start_pos, end_pos)
+            signature_line = text[start_pos:line_end if line_end != -1 else end_pos]
+            method['signature'] = signature_line.strip()
 
             # Extract method name
-            name_match = re.search(r'\w+\s*\(', signature_lines)
+            name_match = _NAME_RE.search(signature_line)
             if name_match:
                 method['name'] = name_match.group(0)[:-1].strip()
 
             # Extract parameters
-            method['parameters'] = self.extract_parameters(signature_lines)
+            method['parameters'] = self.extract_parameters(signature_line)
 
             # Extract return type
             method['return_type'] = self.extract_return_type(method_content)
 
             # Extract description
-            desc_match = re.search(self.patterns.METHOD_DESC, method_content, re.DOTALL)
+            desc_match = self.patterns.METHOD_DESC.search(method_content)
             if desc_match:
                 method['description'] = self.clean_description(desc_match.group(1).strip())
 
@@ -225,7 +314,7 @@ class ContentExtractor:
     def extract_parameters(self, signature: str) -> List[str]:
         """Extract parameters from method signature"""
         params = []
-        param_match = re.search(r'\((.*?)\)', signature)
+        param_match = _PARAMS_RE.search(signature)
         if param_match:
             param_str = param_match.group(1)
             if param_str.strip():
@@ -234,7 +323,7 @@ class ContentExtractor:
 
     def extract_return_type(self, content: str) -> str:
         """Extract return type from method content"""
-        return_match = re.search(r'Return.*?Type:\s*(\w+(?:\.\w+)*)', content, re.DOTALL)
+        return_match = _RETURN_TYPE_RE.search(content)
         if return_match:
             return return_match.group(1)
         return ''
\ No newline at end of file
@@ -1,14 +1,69 @@
 # processor.py
-import pdfplumber
-import re
 import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 from patterns import PDFPatterns, ContentExtractor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PDFium (C++) extracts text far faster than pdfplumber's pure-Python pdfminer
+# backend; pdfplumber remains the fallback when pypdfium2 is not installed
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+    import pdfplumber
+
+def _count_pages(pdf_path: str) -> int:
+    """Return the number of pages in the PDF."""
+    if pdfium is None:
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+def _extract_pages(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) in a worker process.
+
+    Open PDF documents can't be pickled, so each worker opens the PDF itself.
+    """
+    if pdfium is None:
+        with pdfplumber.open(pdf_path) as pdf:
+            return [pdf.pages[i].extract_text() for i in range(start, stop)]
+
+    pages = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for i in range(start, stop):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            # PDFium ends lines with \r\n; the section patterns expect \n
+            pages.append(textpage.get_text_range().replace('\r\n', '\n'))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return pages
+
 class PDFDocProcessor:
-    def __init__(self, debug=True):
+    def __init__(self, debug=True, workers: int = 1):
         self.debug = debug
+        # Pages are extracted in process by default. workers > 1 opts into a process
+        # pool, which only pays off on long documents; on spawn platforms (Windows,
+        # macOS) the calling script must then guard its entry point with
+        # `if __name__ == "__main__":` and call multiprocessing.freeze_support().
+        # The pool only serves the pdfplumber backend: workers is ignored (and logged)
+        # when pypdfium2 is installed
+        self.workers = workers
         self.extractor = ContentExtractor()
         self.current_page = 0
 
@@ -22,18 +77,36 @@ class PDFDocProcessor:
     def extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
         """Extract text from PDF with page tracking"""
         try:
-            all_text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                self.log(f"Processing PDF with {len(pdf.pages)} pages")
-                
-                for i, page in enumerate(pdf.pages):
-                    self.current_page = i + 1
-                    text = page.extract_text()
-                    if text:
-                        # Add page number markers for later reference
-                        all_text += f"\n[PAGE_{i+1}]\n{text}\n[/PAGE_{i+1}]\n"
+            page_count = _count_pages(pdf_path)
+            self.log(f"Processing PDF with {page_count} pages")
+
+            # Give each worker one contiguous batch of pages; results come back in page order.
+            # PDFium extracts faster in process than the pool can start and pickle, so
+            # the pool only serves the slower pdfplumber backend
+            if pdfium is not None:
+                if self.workers > 1:
+                    self.log(f"pypdfium2 is installed; ignoring workers={self.workers} and extracting in process")
+                workers = 1
+            else:
+                workers = max(1, min(self.workers, page_count))
+            if workers > 1:
+                batch = -(-page_count // workers)
+                starts = range(0, page_count, batch)
+                stops = [min(start + batch, page_count) for start in starts]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    pages = list(chain.from_iterable(executor.map(_extract_pages, repeat(pdf_path), starts, stops)))
+            else:
+                pages = _extract_pages(pdf_path, 0, page_count)
+
+            # Collect page chunks and join once; repeated str += copies the whole buffer
+            chunks = []
+            for i, text in enumerate(pages):
+                self.current_page = i + 1
+                if text:
+                    # Add page number markers for later reference
+                    chunks.append(f"\n[PAGE_{i+1}]\n{text}\n[/PAGE_{i+1}]\n")
                         
-            return all_text
+            return "".join(chunks)
             
         except Exception as e:
             self.log(f"Error extracting text: {str(e)}", error=True)
@@ -59,11 +132,11 @@ class PDFDocProcessor:
         }
 
         # Extract title and description
-        title_match = re.search(PDFPatterns.TITLE, text)
+        title_match = PDFPatterns.TITLE.search(text)
         if title_match:
             doc["title"] = title_match.group(0)
 
-        desc_match = re.search(PDFPatterns.MAIN_DESC, text, re.DOTALL)
+        desc_match = PDFPatterns.MAIN_DESC.search(text)
         if desc_match:
             doc["description"] = desc_match.group(0)
 
@@ -77,6 +150,12 @@ class PDFDocProcessor:
 
     def save_json(self, data: Dict, output_path: str) -> None:
         """Save the JSON data to file"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            # orjson serializes straight to UTF-8 bytes, so write them in binary mode
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump writes many small fragments; a 1MB buffer turns them into a few large writes
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(data, f, indent=2)
         self.log(f"Saved JSON to: {output_path}")
\ No newline at end of file
@@ -1,53 +1,88 @@
 import json
+import os
 import re
 import pdfplumber
 
-def extract_data(file_path):
+# Compiled once at import; extract_data applies these to every page and paragraph
+_PAGE_SPLIT_RE = re.compile(r'--- PAGE \d+ ---\n')
+_DIGITS_RE = re.compile(r'\d+')
+_PARA_SPLIT_RE = re.compile(r'\n(?=[A-Z])')
+# Return-type tokens are separated by \s+ explicitly; a class that also matched \s would overlap the
+# surrounding \s+ and backtrack cubically on long whitespace runs (about 128s for 3000 spaces)
+_METHOD_SIG_RE = re.compile(r'(public|global|static)\s+([\w<>\[\]]+(?:\s+[\w<>\[\]]+)*)\s+(\w+)\s*\((.*)\)')
+
+def _split_parameters(parameters_str):
     """
-    Extracts data from a PDF file (specifically the Apex Reference Guide) and structures it into a JSON format
-    using the pdfplumber library.
+    Splits a method parameter list on its top-level commas.
+
+    Commas nested inside generic, array or parenthesised types (e.g. Map<String, Integer>) are kept
+    with their parameter. This is a single linear scan, so unlike a lookahead regex it cannot backtrack.
+
+    Args:
+        parameters_str (str): The text between the parentheses of a method signature.
+
+    Returns:
+        list: The individual parameter strings, unstripped.
+    """
+    params = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(parameters_str):
+        if char in '<([':
+            depth += 1
+        elif char in '>)]':
+            depth = max(depth - 1, 0)
+        elif char == ',' and depth == 0:
+            params.append(parameters_str[start:i])
+            start = i + 1
+    params.append(parameters_str[start:])
+    return params
+
+def iter_sections(file_path):
+    """
+    Extracts sections from a PDF file (specifically the Apex Reference Guide) one at a time using the
+    pdfplumber library.
 
     This function reads the content of the PDF file page by page, splits each page into sections based on
     page markers, and then extracts the title and content of each section. It handles cases where there
     might not be a clear separation between title and content. It also identifies list items, code blocks,
     and method signatures, including their parameters and return types.
 
-    The extracted data is then organized into a JSON structure with the document name and a list of sections,
-    each containing a title and a list of content items (paragraphs, lists, or code blocks).
+    Each section is yielded as soon as it is parsed, so callers can process or write it without holding
+    the whole document in memory.
 
     Args:
         file_path (str): The path to the PDF file.
 
-    Returns:
-        dict: A dictionary containing the structured data in JSON format.
+    Yields:
+        dict: A section with its title and a list of content items (paragraphs, lists, or code blocks).
     """
 
-    data = []
     with pdfplumber.open(file_path) as pdf:
         for page in pdf.pages:
             # Extract text content from the page
             text = page.extract_text()
 
             # Split the content into sections based on page markers (assuming each page is a section)
-            sections = re.split(r'--- PAGE \d+ ---\n', text)[1:]  # Skip the first empty split
+            sections = _PAGE_SPLIT_RE.split(text)[1:]  # Skip the first empty split
 
             for section in sections:
                 # Split each section into title and content, but handle cases with no empty line
                 try:
-                    title, content = re.split(r'\n\n', section, 1)
+                    title, content = section.split('\n\n', 1)
                 except ValueError:
                     # If no empty line, assume the whole section is the content
                     title = ""  # Or you can set a default title
                     content = section
 
                 # Remove page numbers and extra whitespaces from the title
-                title = re.sub(r'\d+', '', title).strip()
+                title = _DIGITS_RE.sub('', title).strip()
 
                 # Remove leading and trailing whitespaces from the content
                 content = content.strip()
 
                 # Split the content into paragraphs based on a capital letter at the beginning of a line
-                paragraphs = re.split(r'\n(?=[A-Z])', content)
+                paragraphs = _PARA_SPLIT_RE.split(content)
 
                 content_list = []
                 for paragraph in paragraphs:
@@ -64,59 +99,91 @@ def extract_data(file_path):
                             "type": "code",
                             "content": paragraph.strip()
                         })
-                    # Check if the paragraph is a method signature (contains 'public' or 'global')
-                    elif 'public ' in paragraph or 'global ' in paragraph or 'static ' in paragraph:
+                    # Check if the paragraph is a method signature (starts with 'public', 'global' or 'static');
+                    # the anchored regex rejects everything else, so no separate substring checks are needed
+                    elif match := _METHOD_SIG_RE.match(paragraph):
                         # Extract method signature details (name, parameters, return type)
-                        match = re.match(r'(public|global|static)\s+([\w<>\[\]\s]+)\s+(\w+)\s*\((.*)\)', paragraph)
-                        if match:
-                            return_type = match.group(2).strip()
-                            name = match.group(3)
-                            parameters_str = match.group(4)
-                            parameters = []
-                            if parameters_str:
-                                # Split parameters by comma, but handle commas within nested types
-                                for param in re.split(r',\s*(?![^<>\[\]()]*[\])])', parameters_str):
-                                    param_parts = param.strip().split(' ')
-                                    parameters.append({
-                                        "type": ' '.join(param_parts[:-1]),  # Handle multi-word types
-                                        "name": param_parts[-1]
-                                    })
-                            content_list.append({
-                                "type": "method",
-                                "name": name,
-                                "signature": paragraph.strip(),
-                                "parameters": parameters,
-                                "return_type": return_type
-                            })
-                        else:
-                            # If not a method signature, treat it as a regular paragraph
-                            content_list.append({
-                                "type": "paragraph",
-                                "content": paragraph.strip()
-                            })
+                        return_type = match.group(2).strip()
+                        name = match.group(3)
+                        parameters_str = match.group(4)
+                        parameters = []
+                        if parameters_str:
+                            # Split parameters by comma, but handle commas within nested types
+                            for param in _split_parameters(parameters_str):
+                                param_parts = param.strip().split(' ')
+                                parameters.append({
+                                    "type": ' '.join(param_parts[:-1]),  # Handle multi-word types
+                                    "name": param_parts[-1]
+                                })
+                        content_list.append({
+                            "type": "method",
+                            "name": name,
+                            "signature": paragraph.strip(),
+                            "parameters": parameters,
+                            "return_type": return_type
+                        })
                     else:
-                        # If not a list or code block, treat it as a regular paragraph
+                        # If not a list, code block or method signature, treat it as a regular paragraph
                         content_list.append({
                             "type": "paragraph",
                             "content": paragraph.strip()
                         })
 
-                data.append({
+                yield {
                     "title": title,
                     "content": content_list
-                })
+                }
 
-    json_data = {
+def extract_data(file_path):
+    """
+    Extracts data from a PDF file (specifically the Apex Reference Guide) and structures it into a JSON format.
+
+    The extracted data is organized into a JSON structure with the document name and a list of sections,
+    as produced by iter_sections.
+
+    Args:
+        file_path (str): The path to the PDF file.
+
+    Returns:
+        dict: A dictionary containing the structured data in JSON format.
+    """
+    return {
         "document": "Apex Reference Guide",
-        "sections": data
+        "sections": list(iter_sections(file_path))
     }
 
-    return json_data
+def save_data(file_path, output_path):
+    """
+    Extracts data from a PDF file and streams it to a JSON file one section at a time.
+
+    The output matches json.dump(extract_data(file_path), f, indent=4), but only one section is held in
+    memory at a time. Sections are written to a temporary file next to output_path, which replaces
+    output_path only once extraction succeeds, so a failed run leaves any previous output intact.
+
+    Args:
+        file_path (str): The path to the PDF file.
+        output_path (str): The path of the JSON file to write.
+    """
+    tmp_path = output_path + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write('{\n    "document": "Apex Reference Guide",\n    "sections": [')
+            empty = True
+            for section in iter_sections(file_path):
+                f.write('\n        ' if empty else ',\n        ')
+                # Encoded JSON never contains a raw newline inside a string, so re-indenting each line is safe
+                f.write(json.dumps(section, indent=4).replace('\n', '\n        '))
+                empty = False
+            # An empty list closes on the same line, as json.dump writes it
+            f.write(']\n}' if empty else '\n    ]\n}')
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 # Example usage:
 file_path = 'apex_reference.pdf'  # Replace with your PDF file path
-json_data = extract_data(file_path)
 
 # Save the extracted data to a JSON file
-with open('output.json', 'w') as f:
-    json.dump(json_data, f, indent=4)
\ No newline at end of file
+save_data(file_path, 'output.json')
\ No newline at end of file